@@ -8,44 +8,81 @@ from scrapy.http import JsonRequest
 
 class DairyQueen(scrapy.Spider):
     name = "dairyqueen"
+    API_URL = "https://prod-api.dairyqueen.com/graphql/"
+    NEARBY_STORES_QUERY = 'fragment StoreDetailFields on Store {\n  id\n  storeNo\n  address3\n  city\n  stateProvince\n  postalCode\n  country\n  latitude\n  longitude\n  phone\n  availabilityStatus\n  conceptType\n  restaurantId\n  utcOffset\n  supportedTimeModes\n  advanceOrderDays\n  storeHours(hoursFormat: "yyyy/MM/dd HH:mm") {\n    calendarType\n    ranges {\n      start\n      end\n      weekday\n      __typename\n    }\n    __typename\n  }\n  minisite {\n    webLinks {\n      isDeliveryPartner\n      description\n      url\n      __typename\n    }\n    hours {\n      calendarType\n      ranges {\n        start\n        end\n        weekday\n        __typename\n      }\n      __typename\n    }\n    amenities {\n      description\n      featureId\n      __typename\n    }\n    __typename\n  }\n  flags {\n    blizzardFanClubFlag\n    brazierFlag\n    breakfastFlag\n    cakesFlag\n    canPickup\n    comingSoonFlag\n    creditCardFlag\n    curbSideFlag\n    deliveryFlag\n    dispatchFlag\n    driveThruFlag\n    foodAndTreatsFlag\n    giftCardsFlag\n    mobileDealsFlag\n    mobileOrderingFlag\n    mtdFlag\n    ojQuenchClubFlag\n    onlineOrderingFlag\n    ojFlag\n    temporarilyClosedFlag\n    supportsManualFire\n    supportsSplitPayments\n    isCurrentlyOpen\n    __typename\n  }\n  labels {\n    key\n    value\n    __typename\n  }\n  __typename\n}\n\nquery NearbyStores($lat: Float!, $lng: Float!, $country: String!, $searchRadius: Int!) {\n  nearbyStores(\n    lat: $lat\n    lon: $lng\n    country: $country\n    radiusMiles: $searchRadius\n    limit: 50\n    first: 20\n    order: {distance: ASC}\n  ) {\n    pageInfo {\n      endCursor\n      hasNextPage\n      __typename\n    }\n    nodes {\n      distance\n      distanceType\n      store {\n        ...StoreDetailFields\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n'
+    SEARCH_CELL_SIZE = 0.1
+    NEARBY_STORES_PAGE_SIZE = 20  # matches "first: 20" in NEARBY_STORES_QUERY
+    DAY_MAPPING = {
+        "mon": "monday",
+        "tue": "tuesday",
+        "wed": "wednesday",
+        "thu": "thursday",
+        "fri": "friday",
+        "sat": "saturday",
+        "sun": "sunday"
+    }
     custom_settings = dict(
         DOWNLOAD_HANDLERS = {
             "http": "scrapy_impersonate.ImpersonateDownloadHandler",
             "https": "scrapy_impersonate.ImpersonateDownloadHandler",
         },
-        USER_AGENT = None
+        USER_AGENT = None,
+        CONCURRENT_REQUESTS = 32,
+        CONCURRENT_REQUESTS_PER_DOMAIN = 16,
     )
 
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processed_store_numbers = set()
+
     
     def start_requests(self) -> Iterable[Request]:
         zipcodes = load_zipcode_data("data/zipcode_lat_long.json")
-        for zipcode in zipcodes:
-            json_data = {
-                'operationName': 'NearbyStores',
-                'variables': {
-                    'lat': zipcode['latitude'],
-                    'lng': zipcode['longitude'],
-                    'country': 'US',
-                    'searchRadius': 25,
-                },
-                'query': 'fragment StoreDetailFields on Store {\n  id\n  storeNo\n  address3\n  city\n  stateProvince\n  postalCode\n  country\n  latitude\n  longitude\n  phone\n  availabilityStatus\n  conceptType\n  restaurantId\n  utcOffset\n  supportedTimeModes\n  advanceOrderDays\n  storeHours(hoursFormat: "yyyy/MM/dd HH:mm") {\n    calendarType\n    ranges {\n      start\n      end\n      weekday\n      __typename\n    }\n    __typename\n  }\n  minisite {\n    webLinks {\n      isDeliveryPartner\n      description\n      url\n      __typename\n    }\n    hours {\n      calendarType\n      ranges {\n        start\n        end\n        weekday\n        __typename\n      }\n      __typename\n    }\n    amenities {\n      description\n      featureId\n      __typename\n    }\n    __typename\n  }\n  flags {\n    blizzardFanClubFlag\n    brazierFlag\n    breakfastFlag\n    cakesFlag\n    canPickup\n    comingSoonFlag\n    creditCardFlag\n    curbSideFlag\n    deliveryFlag\n    dispatchFlag\n    driveThruFlag\n    foodAndTreatsFlag\n    giftCardsFlag\n    mobileDealsFlag\n    mobileOrderingFlag\n    mtdFlag\n    ojQuenchClubFlag\n    onlineOrderingFlag\n    ojFlag\n    temporarilyClosedFlag\n    supportsManualFire\n    supportsSplitPayments\n    isCurrentlyOpen\n    __typename\n  }\n  labels {\n    key\n    value\n    __typename\n  }\n  __typename\n}\n\nquery NearbyStores($lat: Float!, $lng: Float!, $country: String!, $searchRadius: Int!) {\n  nearbyStores(\n    lat: $lat\n    lon: $lng\n    country: $country\n    radiusMiles: $searchRadius\n    limit: 50\n    first: 20\n    order: {distance: ASC}\n  ) {\n    pageInfo {\n      endCursor\n      hasNextPage\n      __typename\n    }\n    nodes {\n      distance\n      distanceType\n      store {\n        ...StoreDetailFields\n        __typename\n      }\n      __typename\n    }\n    __typename\n  }\n}\n',
-            }
-            yield JsonRequest(
-                url="https://prod-api.dairyqueen.com/graphql/", 
-                method="POST", 
-                data=json_data, 
-                callback=self.parse_stores,
-                headers={'partner-platform': 'Web'},
-                meta={"impersonate": "chrome"}
-            )
-
-
-    def parse_stores(self, response: Response):
+        # Zipcodes in the same search cell mostly return the same 25 mile results,
+        # so query one per cell and only fan out when that query hits the result cap
+        for first_zipcode, *other_zipcodes in group_zipcodes_by_cell(zipcodes, cell_size=self.SEARCH_CELL_SIZE):
+            yield self._nearby_stores_request(first_zipcode, other_zipcodes)
+
+
+    def _nearby_stores_request(self, zipcode: Dict, other_zipcodes: List[Dict]) -> JsonRequest:
+        json_data = {
+            'operationName': 'NearbyStores',
+            'variables': {
+                'lat': zipcode['latitude'],
+                'lng': zipcode['longitude'],
+                'country': 'US',
+                'searchRadius': 25,
+            },
+            'query': self.NEARBY_STORES_QUERY,
+        }
+        return JsonRequest(
+            url=self.API_URL, 
+            method="POST", 
+            data=json_data, 
+            callback=self.parse_stores,
+            headers={'partner-platform': 'Web'},
+            meta={"impersonate": "chrome"},
+            cb_kwargs={"other_zipcodes": other_zipcodes},
+        )
+
+
+    def parse_stores(self, response: Response, other_zipcodes: List[Dict]):
         nodes = response.json().get("data", {}).get("nearbyStores", {}).get("nodes", [])
+        if len(nodes) >= self.NEARBY_STORES_PAGE_SIZE:
+            # A full page may leave out stores at the edge of the cell, so search from every zipcode in it
+            for zipcode in other_zipcodes:
+                yield self._nearby_stores_request(zipcode, [])
         for node in nodes:
             store = node.get("store")
+            store_number = store.get("storeNo")
+            if store_number:
+                if store_number in self.processed_store_numbers:
+                    self.logger.debug("Skipping duplicate store: %s", store_number)
+                    continue
+                self.processed_store_numbers.add(store_number)
             item = {
-                "number": store.get("storeNo"),
+                "number": store_number,
                 "location": {
                     "type": "Point",
                     "coordinates": [store.get("longitude"), store.get("latitude")]
@@ -79,7 +116,7 @@ class DairyQueen(scrapy.Spider):
                 store.get('address2'),
                 store.get('address3'),
             ]
-            street = ", ".join(filter(None, address_parts))
+            street = join_nonblank(address_parts)
 
             city = store['city']
             state = store['stateProvince']
@@ -89,28 +126,19 @@ class DairyQueen(scrapy.Spider):
 
             city_state_zip = f"{city}, {state} {zipcode}".strip()
 
-            return ", ".join(filter(None, [street, city_state_zip])).replace(",,",",")
+            return join_nonblank([street, city_state_zip])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
 
 
     def _get_hours(self, hours_data: List):
-        days_mapping = {
-            "mon": "monday",
-            "tue": "tuesday",
-            "wed": "wednesday",
-            "thu": "thursday",
-            "fri": "friday",
-            "sat": "saturday",
-            "sun": "sunday"
-        }
         hours = {}
         try:
             for calendar_type in hours_data:
                 for hour_range in calendar_type.get("ranges"):
                     weekday = hour_range.get("weekday").lower()
-                    hours[days_mapping.get(weekday)] = {
+                    hours[self.DAY_MAPPING.get(weekday)] = {
                         "open": convert_to_12h_format(hour_range.get('start').split(" ")[-1]), 
                         "close": convert_to_12h_format(hour_range.get('end').split(" ")[-1]), 
                     }
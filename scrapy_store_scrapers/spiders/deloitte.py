@@ -36,19 +36,18 @@ class Deloitte(scrapy.Spider):
 
     def _get_address(self, address: Dict) -> str:
         try:
-            address_parts = [i for i in address.get("streetAddress") if i.strip()]
+            address_parts = [part.replace("\u200b", "") for part in address.get("streetAddress")]
+            street = join_nonblank(address_parts)
 
-            street = ", ".join(filter(None, address_parts))
-
-            city = address.get("addressLocality", "")
-            state = address.get("addressRegion", "")
-            zipcode = address.get("postalCode", "")
+            city = address.get("addressLocality", "").replace("\u200b", "")
+            state = address.get("addressRegion", "").replace("\u200b", "")
+            zipcode = address.get("postalCode", "").replace("\u200b", "")
             if "-" in zipcode:
                 zipcode = zipcode.split("-")[0]
 
             city_state_zip = f"{city}, {state} {zipcode}".strip()
 
-            return ", ".join(filter(None, [street, city_state_zip])).replace("\u200b","").replace(", ,", ",").strip()
+            return join_nonblank([street, city_state_zip])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
@@ -6,6 +6,7 @@ import chompjs
 
 class DelTaco(scrapy.Spider):
     name = "deltaco"
+    STORE_JSON_XPATH = "//script[@type='application/ld+json' and contains(text(), 'Restaurant')]/text()"
 
 
     def start_requests(self) -> Iterable[Request]:
@@ -29,7 +30,7 @@ class DelTaco(scrapy.Spider):
 
 
     def parse_store(self, response: Response):
-        obj = chompjs.parse_js_object(response.xpath("//script[contains(text(), 'Restaurant')]/text()").get().strip())
+        obj = self._load_store_json(response.xpath(self.STORE_JSON_XPATH).get().strip())
         item = {
             "number": response.xpath("//script[contains(text(), 'dimensionLocationNumber')]/text()").re_first(r"(?:dimensionLocationNumber\'\:\s\')(.*?)(?:\')"),
             "name": obj.get("name"),
@@ -49,12 +50,21 @@ class DelTaco(scrapy.Spider):
         return item
 
 
+    @staticmethod
+    def _load_store_json(script_text: str) -> Dict:
+        """Decode the JSON-LD block, falling back to chompjs for non-strict JSON."""
+        try:
+            return json_loads(script_text)
+        except json.JSONDecodeError:
+            return chompjs.parse_js_object(script_text)
+
+
     def _get_address(self, address: Dict) -> str:
         try:
             address_parts = [
                 address['streetAddress'],
             ]
-            street = ", ".join(filter(None, address_parts))
+            street = join_nonblank(address_parts)
 
             city = address['addressLocality']
             state = address['addressRegion']
@@ -62,7 +72,7 @@ class DelTaco(scrapy.Spider):
 
             city_state_zip = f"{city}, {state} {zipcode}".strip()
 
-            return ", ".join(filter(None, [street, city_state_zip])).replace(",,",",")
+            return join_nonblank([street, city_state_zip])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
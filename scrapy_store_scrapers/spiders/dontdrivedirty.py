@@ -6,11 +6,13 @@ from scrapy_store_scrapers.utils import *
 
 class DontDriveDirty(scrapy.Spider):
     name = "dontdrivedirty"
+    DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+    DAY_RANGE_RE = re.compile(r"mon - (sun|sat)")
 
 
     def start_requests(self) -> Iterable[Request]:
         zipcodes = load_zipcode_data("data/zipcode_lat_long.json")
-        for zipcode in zipcodes:
+        for zipcode in dedupe_zipcodes_by_cell(zipcodes, cell_size=0.2):
             url = f"https://www.dontdrivedirty.com/locationsandpricing/?zipcode={zipcode['zipcode']}"
             yield scrapy.Request(url, callback=self.parse)
 
@@ -48,7 +50,7 @@ class DontDriveDirty(scrapy.Spider):
             address_parts = [
                 address['streetAddress'],
             ]
-            street = ", ".join(filter(None, address_parts))
+            street = join_nonblank(address_parts)
 
             city = address['addressLocality']
             state = address['addressRegion']
@@ -58,34 +60,27 @@ class DontDriveDirty(scrapy.Spider):
 
             city_state_zip = f"{city}, {state} {zipcode}".strip()
 
-            return ", ".join(filter(None, [street, city_state_zip])).replace(",,", ",").strip()
+            return join_nonblank([street, city_state_zip])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
         
     
     def _get_hours(self, obj: Dict) -> dict:
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        hours = {}
         try:
-            opening_hours = obj['openingHours'].lower()
-            if opening_hours.strip() == "-":
+            opening_hours = obj['openingHours'].lower().strip()
+            match = self.DAY_RANGE_RE.search(opening_hours)
+            if opening_hours == "-" or not match:
                 return {}
-            if "mon - sun" in opening_hours:
-                for day in days:
-                    hours_range = obj['openingHours'].lower().replace("mon - sun", "").strip()
-                    hours[day] = {
-                        "open": hours_range.split(" - ")[0].strip().replace(".",""),
-                        "close": hours_range.split(" - ")[1].strip().replace(".","")
-                    }
-            elif "mon - sat" in opening_hours:
-                for day in days[:-1]:
-                    hours_range = obj['openingHours'].lower().split("mon - sat")[0].replace("mon - sat", "").strip()
-                    hours[day] = {
-                        "open": hours_range.split(" - ")[0].strip().replace(".",""),
-                        "close": hours_range.split(" - ")[1].strip().replace(".","")
-                    }
-            return hours
+            if match.group(1) == "sun":
+                days = self.DAYS
+                hours_range = opening_hours[:match.start()] + opening_hours[match.end():]
+            else:
+                days = self.DAYS[:-1]
+                hours_range = opening_hours[:match.start()]
+            open_time, close_time = hours_range.strip().replace(".", "").split(" - ")[:2]
+            open_time, close_time = open_time.strip(), close_time.strip()
+            return {day: {"open": open_time, "close": close_time} for day in days}
         except Exception as e:
             self.logger.error("Error getting hours: %s", e, exc_info=True)
             return {}
\ No newline at end of file
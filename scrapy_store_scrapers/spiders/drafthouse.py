@@ -44,7 +44,7 @@ class DraftHouse(scrapy.Spider):
                 address.get("street1", ""),
                 address.get("street2", ""),
             ]
-            street = ", ".join(filter(None, address_parts))
+            street = join_nonblank(address_parts)
 
             city = address.get("city", "")
             state = address.get("state", "")
@@ -54,7 +54,7 @@ class DraftHouse(scrapy.Spider):
 
             city_state_zip = f"{city}, {state} {zipcode}".strip()
 
-            return ", ".join(filter(None, [street, city_state_zip]))
+            return join_nonblank([street, city_state_zip])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
\ No newline at end of file
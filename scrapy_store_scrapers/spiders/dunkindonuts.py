@@ -1,10 +1,14 @@
 import json
+import logging
+import re
 from datetime import datetime
 from typing import Any, Generator
 
 import scrapy
 from scrapy.http import Response
 
+from scrapy_store_scrapers.utils import TIME_12H_LOOKUP, join_nonblank, json_loads, make_point
+
 
 class DunkinDonutsSpider(scrapy.Spider):
     """Spider for scraping Dunkin' Donuts store locations."""
@@ -13,24 +17,30 @@ class DunkinDonutsSpider(scrapy.Spider):
     allowed_domains = ["locations.dunkindonuts.com"]
     start_urls = ["http://locations.dunkindonuts.com/en"]
     required_fields = ['address', 'location', 'url', 'raw']
+    LOGGED_FIELDS = ('number', 'phone_number', 'address', 'location', 'hours', 'services', 'url')
+
+    custom_settings = {
+        'CONCURRENT_REQUESTS': 32,
+        'CONCURRENT_REQUESTS_PER_DOMAIN': 32,
+    }
 
     URLS_SCRIPT_TEXT_XPATH = '//script[contains(text(), "window.__INITIAL__DATA__")]/text()'
+    INITIAL_DATA_RE = re.compile(r'window\.__INITIAL__DATA__ = (.*)')
 
     def parse(self, response: Response) -> Generator[scrapy.Request, None, None]:
         """Parse the main page and yield requests for individual store pages."""
         try:
-            script_text = response.xpath(self.URLS_SCRIPT_TEXT_XPATH).re_first(r'window.__INITIAL__DATA__ = (.*)')
+            script_text = response.xpath(self.URLS_SCRIPT_TEXT_XPATH).re_first(self.INITIAL_DATA_RE)
             
             if not script_text:
                 self.logger.error("Failed to extract script text from main page")
                 return
 
-            data = json.loads(script_text)
+            data = json_loads(script_text)
             stores_url_data = data['document']['dm_directoryChildren']
             store_urls = self.extract_store_urls(stores_url_data)
 
-            for store_url in store_urls:
-                yield response.follow(store_url, self.parse_store)
+            yield from response.follow_all(store_urls, self.parse_store)
         except json.JSONDecodeError:
             self.logger.error("Failed to parse JSON data from main page")
         except KeyError as e:
@@ -41,12 +51,12 @@ class DunkinDonutsSpider(scrapy.Spider):
     def parse_store(self, response: Response) -> dict:
         """Parse individual store page and extract store information."""
         try:
-            script_text = response.xpath(self.URLS_SCRIPT_TEXT_XPATH).re_first(r'window.__INITIAL__DATA__ = (.*)')
+            script_text = response.xpath(self.URLS_SCRIPT_TEXT_XPATH).re_first(self.INITIAL_DATA_RE)
             if not script_text:
                 self.logger.error(f"Failed to extract script text from store page: {response.url}")
                 return 
             
-            data = json.loads(script_text)['document']
+            data = json_loads(script_text)['document']
 
             parsed_store = {
                 'number': str(data.get('id', '')),
@@ -120,6 +130,9 @@ class DunkinDonutsSpider(scrapy.Spider):
         """Convert time to 12-hour format."""
         if not time_str:
             return ""
+        converted = TIME_12H_LOOKUP.get(time_str)
+        if converted is not None:
+            return converted
         try:
             time_obj = datetime.strptime(time_str, '%H:%M').time()
             return time_obj.strftime('%I:%M %p').lower().lstrip('0')
@@ -129,19 +142,15 @@ class DunkinDonutsSpider(scrapy.Spider):
     def _get_address(self, address_info: dict) -> str:
         """Format store address."""
         try:
-            address_parts = [
-                address_info.get("line1", ""),
-                address_info.get("line2", ""),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = address_info.get("city", "")
-            state = address_info.get("region", "")
-            zipcode = address_info.get("postalCode", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            full_address = ", ".join(filter(None, [street, city_state_zip]))
+            state = address_info.get("region") or ""
+            zipcode = address_info.get("postalCode") or ""
+
+            full_address = join_nonblank([
+                address_info.get("line1"),
+                address_info.get("line2"),
+                address_info.get("city"),
+                f"{state} {zipcode}",
+            ])
             if not full_address:
                 self.logger.warning(f"Missing address information: {address_info}")
             return full_address
@@ -151,42 +160,37 @@ class DunkinDonutsSpider(scrapy.Spider):
 
     def _get_location(self, location_info: dict) -> dict:
         """Extract and format location coordinates."""
-        try:
-            latitude = location_info.get('latitude')
-            longitude = location_info.get('longitude')
-
-            if latitude is not None and longitude is not None:
-                return {
-                    "type": "Point",
-                    "coordinates": [float(longitude), float(latitude)]
-                }
-            self.logger.warning(f"Missing latitude or longitude: {location_info}")
-        except ValueError as e:
-            self.logger.warning(f"Invalid latitude or longitude values: {e}")
-        except Exception as e:
-            self.logger.error(f"Error extracting location: {e}", exc_info=True)
-        return {}
+        location = make_point(location_info.get('latitude'), location_info.get('longitude'))
+        if not location:
+            self.logger.warning(f"Missing or invalid latitude/longitude: {location_info}")
+        return location
 
     @staticmethod
     def extract_store_urls(data: Any) -> list:
-        """Recursively extract store URLs from the data structure."""
+        """Extract unique store URLs from the data structure using an explicit stack."""
         urls = []
-        
-        def recursive_extract(item: Any) -> None:
+        seen = set()
+        stack = [data]
+
+        while stack:
+            item = stack.pop()
             if isinstance(item, dict):
                 if 'slug' in item and 'dm_directoryChildren' not in item:
-                    urls.append(item['slug'])
-                for value in item.values():
-                    recursive_extract(value)
+                    slug = item['slug']
+                    if slug not in seen:
+                        seen.add(slug)
+                        urls.append(slug)
+                # Push in reverse so items are visited in document order
+                stack.extend(reversed(list(item.values())))
             elif isinstance(item, list):
-                for element in item:
-                    recursive_extract(element)
-        
-        recursive_extract(data)
-        return list(dict.fromkeys(urls))
+                stack.extend(reversed(item))
+
+        return urls
 
     def _log_missing_data(self, parsed_store: dict) -> None:
         """Log warnings for missing data in parsed store information."""
-        for key, value in parsed_store.items():
-            if key != 'raw' and not value:
-                self.logger.warning(f"Missing data for {key} in store: {parsed_store['number']}")
\ No newline at end of file
+        if not self.logger.isEnabledFor(logging.WARNING):
+            return
+        for key in self.LOGGED_FIELDS:
+            if not parsed_store.get(key):
+                self.logger.warning("Missing data for %s in store: %s", key, parsed_store['number'])
\ No newline at end of file
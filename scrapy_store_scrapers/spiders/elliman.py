@@ -12,6 +12,8 @@ from twisted.python.failure import Failure
 class Elliman(scrapy.Spider):
     name = "elliman"
     page_count = 1
+    ZIPCODE_RE = re.compile(r"\|\d{5}\|")
+    BROKER_DETAILS_RE = re.compile(r'(?:brokerdetails_XSLParams\)\;rd\=\")(.*?)(?:")')
     custom_settings = dict(
         PLAYWRIGHT_ABORT_REQUEST = should_abort_request,
         PLAYWRIGHT_BROWSER_TYPE = "firefox",
@@ -75,20 +77,14 @@ class Elliman(scrapy.Spider):
 
 
     def _get_address(self, response: Response) -> str:
-        get_code = lambda string: re.search("\|\d{5}\|", string).group().strip("|")
         try:
-            address_parts = [
-                response.xpath("//span[@class='street-address']/text()").get('').strip(),
-            ]
-            street = ", ".join(filter(None, address_parts))
+            street = response.xpath("//span[@class='street-address']/text()").get('').strip()
 
-            city = response.xpath("//h2/text()").get('').split(",")[0].strip()
-            state = response.xpath("//h2/text()").get('').split(",")[1].strip()
-            zipcode = get_code(re.search(r'(?:brokerdetails_XSLParams\)\;rd\=\")(.*?)(?:")', response.text).group(1))
+            city, state = response.xpath("//h2/text()").get('').split(",")[:2]
+            broker_details = self.BROKER_DETAILS_RE.search(response.text).group(1)
+            zipcode = self.ZIPCODE_RE.search(broker_details).group().strip("|")
 
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            return ", ".join(filter(None, [street, city_state_zip]))
+            return join_nonblank([street, city, f"{state.strip()} {zipcode}"])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
@@ -1,7 +1,10 @@
+from functools import lru_cache
 from typing import Any, Generator
 
 import scrapy
 
+from scrapy_store_scrapers.utils import json_loads, make_point
+
 
 class ElsupermarketsSpider(scrapy.Spider):
     """Spider for scraping store information from elsupermarkets.com"""
@@ -10,11 +13,13 @@ class ElsupermarketsSpider(scrapy.Spider):
     allowed_domains = ["elsupermarkets.com"]
     start_urls = ["https://elsupermarkets.com/wp-json/elsuper/v1/stores"]
 
+    DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
     def parse(self, response: scrapy.http.Response) -> Generator[dict[str, Any], None, None]:
         """Parse the JSON response and yield store information."""
         self.logger.info(f"Parsing response from {response.url}")
         try:
-            stores = response.json()
+            stores = json_loads(response.body)
         except ValueError as e:
             self.logger.error(f"Failed to parse JSON response: {e}")
             return
@@ -51,21 +56,10 @@ class ElsupermarketsSpider(scrapy.Spider):
 
     def _get_location(self, location_info: dict[str, Any]) -> dict[str, Any]:
         """Extract and format location coordinates."""
-        try:
-            latitude = location_info.get("lat")
-            longitude = location_info.get("lng")
-
-            if latitude is not None and longitude is not None:
-                return {
-                    "type": "Point",
-                    "coordinates": [float(longitude), float(latitude)]
-                }
-            self.logger.warning(f"Missing latitude or longitude: {location_info}")
-        except ValueError as e:
-            self.logger.warning(f"Invalid latitude or longitude values: {e}")
-        except Exception as e:
-            self.logger.error(f"Error extracting location: {e}", exc_info=True)
-        return {}
+        location = make_point(location_info.get("lat"), location_info.get("lng"))
+        if not location:
+            self.logger.warning(f"Missing or invalid latitude/longitude: {location_info}")
+        return location
 
     def _get_hours(self, store: dict[str, Any]) -> dict[str, dict[str, str]]:
         """Parse the store hours from the store data."""
@@ -75,24 +69,23 @@ class ElsupermarketsSpider(scrapy.Spider):
             return {}
 
         open_time, close_time = self._parse_hours_range(hours_range)
+        if not open_time or not close_time:
+            self.logger.error(f"Invalid hours format: {hours_range}")
         return self._create_hours_dict(open_time, close_time)
 
-    def _parse_hours_range(self, hours_range: str) -> tuple[str, str]:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _parse_hours_range(hours_range: str) -> tuple[str, str]:
         """Parse the open and close times from the hours range string."""
-        hours_range = hours_range.lower()
         try:
-            open_time, close_time = map(str.strip, hours_range.split("-"))
+            open_time, close_time = map(str.strip, hours_range.lower().split("-"))
             return open_time, close_time
         except ValueError:
-            self.logger.error(f"Invalid hours format: {hours_range}")
             return "", ""
 
-    @staticmethod
-    def _create_hours_dict(open_time: str, close_time: str) -> dict[str, dict[str, str]]:
+    @classmethod
+    def _create_hours_dict(cls, open_time: str, close_time: str) -> dict[str, dict[str, str]]:
         """Create a dictionary of store hours for each day of the week."""
         if not open_time or not close_time:
             return {}
-        return {
-            day: {"open": open_time, "close": close_time}
-            for day in ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        }
+        return {day: {"open": open_time, "close": close_time} for day in cls.DAYS}
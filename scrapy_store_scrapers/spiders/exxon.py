@@ -1,14 +1,20 @@
 from datetime import datetime
-import json
 from typing import Any, Dict, Optional
 import scrapy
 
+from scrapy_store_scrapers.utils import TIME_12H_LOOKUP, join_nonblank, json_loads, make_point
+
 
 class ExxonSpider(scrapy.Spider):
     name = "exxon"
     allowed_domains = ["www.exxon.com"]
     start_urls = ["https://www.exxon.com/en/find-station/alabama"]
 
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
+    }
+
     LINKS_XPATH = '//div[@id="content"]//ul/li/a/@href'
 
     STORE_JSON_XPATH = '//script[@type="application/ld+json" and contains(text(), "LocalBusiness")]/text()'
@@ -16,17 +22,15 @@ class ExxonSpider(scrapy.Spider):
     
     def parse(self, response):
 
-        if response.xpath(self.STORE_JSON_XPATH):
-            yield self._parse_store(response)
+        store_json = response.xpath(self.STORE_JSON_XPATH).get()
+        if store_json:
+            yield self._parse_store(response, store_json)
 
         all_links = response.xpath(self.LINKS_XPATH).getall()
-        for link in all_links:
-            yield response.follow(link, callback=self.parse)
-            break
+        yield from response.follow_all(all_links, callback=self.parse)
 
-    def _parse_store(self, response):
-        store_json = response.xpath(self.STORE_JSON_XPATH).get()
-        store_data = json.loads(store_json)
+    def _parse_store(self, response, store_json):
+        store_data = json_loads(store_json)
 
         parsed_store = {}
 
@@ -46,19 +50,14 @@ class ExxonSpider(scrapy.Spider):
     def _get_address(self, address_info: Dict[str, Any]) -> str:
         """Format store address."""
         try:
-            address_parts = [
-                address_info.get("streetAddress", ""),
-                # address_info.get("address_2", ""),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = address_info.get("addressLocality", "")
-            state = address_info.get("addressCountry", "")
-            zipcode = address_info.get("postalCode", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            full_address = ", ".join(filter(None, [street, city_state_zip]))
+            state = address_info.get("addressCountry") or ""
+            zipcode = address_info.get("postalCode") or ""
+
+            full_address = join_nonblank([
+                address_info.get("streetAddress"),
+                address_info.get("addressLocality"),
+                f"{state} {zipcode}",
+            ])
             if not full_address:
                 self.logger.warning(
                     f"Missing address information: {address_info}")
@@ -69,26 +68,11 @@ class ExxonSpider(scrapy.Spider):
 
     def _get_location(self, location_info: Dict[str, Any]) -> Dict[str, Any]:
         """Extract and format location coordinates."""
-        try:
-            latitude = location_info.get('latitude')
-            longitude = location_info.get('longitude')
-
-            if latitude is not None and longitude is not None:
-                return {
-                    "type": "Point",
-                    "coordinates": [float(longitude), float(latitude)]
-                }
-
+        location = make_point(location_info.get('latitude'), location_info.get('longitude'))
+        if not location:
             self.logger.warning(
-                f"Missing latitude or longitude for store: {location_info}")
-            return {}
-        except ValueError as error:
-            self.logger.warning(
-                f"Invalid latitude or longitude values: {error}")
-        except Exception as error:
-            self.logger.error(
-                f"Error extracting location: {error}", exc_info=True)
-        return {}
+                f"Missing or invalid latitude/longitude for store: {location_info}")
+        return location
 
     def _get_hours(self, raw_store_data: Dict[str, Any]) -> Dict[str, Dict[str, Optional[str]]]:
         """Extract and parse store hours."""
@@ -99,15 +83,13 @@ class ExxonSpider(scrapy.Spider):
                     f"No hours found for store {raw_store_data}")
                 return {}
 
-            hours = {}
-
-            for day in hours_raw["@dayOfWeek"]:
-                day = day.lower()
-
-                open_time = self._convert_to_12h_format(hours_raw["@opens"])
-                close_time = self._convert_to_12h_format(hours_raw["@closes"])
+            open_time = self._convert_to_12h_format(hours_raw["@opens"])
+            close_time = self._convert_to_12h_format(hours_raw["@closes"])
 
-                hours[day] = {"open": open_time, "close": close_time}
+            hours = {
+                day.lower(): {"open": open_time, "close": close_time}
+                for day in hours_raw["@dayOfWeek"]
+            }
 
             if not hours:
                 self.logger.warning(
@@ -123,6 +105,9 @@ class ExxonSpider(scrapy.Spider):
         """Convert time to 12-hour format."""
         if not time_str:
             return time_str
+        converted = TIME_12H_LOOKUP.get(time_str)
+        if converted is not None:
+            return converted
         try:
             time_obj = datetime.strptime(time_str, '%H:%M').time()
             return time_obj.strftime('%I:%M %p').lower().lstrip('0')
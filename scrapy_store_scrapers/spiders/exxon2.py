@@ -7,10 +7,15 @@ from scrapy_store_scrapers.utils import *
 class Exxon(scrapy.Spider):
     name = "exxon2"
     custom_settings = {
-        "CONCURRENT_REQUESTS": 16,
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
         "DOWNLOAD_DELAY": 0,
     }
 
+    CONTENT_LINKS_XPATH = "//div[@id='content']//a[@target='_self']/@href"
+    STATIONS_PAGE_XPATH = "//h2[contains(text(), 'See All Gas Station')]"
+    STORE_JSON_XPATH = "//script[@type='application/ld+json' and contains(text(), 'LocalBusiness')]/text()"
+
 
     def start_requests(self) -> Iterable[Request]:
         url = "https://www.exxon.com/en/find-station/united-states"
@@ -18,37 +23,31 @@ class Exxon(scrapy.Spider):
 
 
     def parse(self, response: Response):
-        states = response.xpath("//div[@id='content']//a[@target='_self']/@href").getall()
+        states = response.xpath(self.CONTENT_LINKS_XPATH).getall()
         yield from response.follow_all(states, callback=self.parse_state)
 
 
     def parse_state(self, response: Response):
-        stations = response.xpath("//div[@id='content']//a[@target='_self']/@href").getall()
+        stations = response.xpath(self.CONTENT_LINKS_XPATH).getall()
         yield from response.follow_all(stations, callback=self.parse_station)
 
     
     def parse_station(self, response: Response):
-        stations_page = response.xpath("//h2[contains(text(), 'See All Gas Station')]")
+        stations_page = response.xpath(self.STATIONS_PAGE_XPATH)
         if stations_page:
-            stations = response.xpath("//div[@id='content']//a[@target='_self']/@href").getall()
+            stations = response.xpath(self.CONTENT_LINKS_XPATH).getall()
             if stations:
                 yield from response.follow_all(stations, callback=self.parse_station)
         else:
-            string = response.xpath("//script[contains(text(), 'LocalBusiness')]/text()").get()
+            string = response.xpath(self.STORE_JSON_XPATH).get()
             if string is None:
                 return
-            obj = json.loads(string)
+            obj = json_loads(string)
             yield {
                 "name": response.xpath("//h1[contains(@class, 'screen-title')]/text()").get(),
                 "phone_number": obj["telephone"],
                 "address": self._get_address(obj),
-                "location": {
-                    "type": "Point",
-                    "coordinates": [
-                        float(obj["geo"]["longitude"]),
-                        float(obj["geo"]["latitude"])
-                    ]
-                },
+                "location": make_point(obj["geo"]["latitude"], obj["geo"]["longitude"]),
                 "hours": self._get_hours(obj),
                 "services": response.xpath("//ul[contains(@class, 'station-details-featuredItem') and ./preceding-sibling::h3[not(text()='Location hours')]]/li/text()").getall(),
                 "url": response.url,
@@ -58,20 +57,14 @@ class Exxon(scrapy.Spider):
     
     def _get_address(self, obj: Dict) -> str:
         try:
-            address_parts = [
-                obj['address']['streetAddress'],
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = obj['address']["addressLocality"]
-            state = obj['address']['addressCountry']
-            zipcode = obj['address']['postalCode']
-            if "-" in zipcode:
-                zipcode = zipcode.split("-")[0]
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
+            address = obj['address']
+            zipcode = address['postalCode'].split("-")[0]
 
-            return ", ".join(filter(None, [street, city_state_zip])).replace(",,", ",").strip()
+            return join_nonblank([
+                address['streetAddress'],
+                address["addressLocality"],
+                f"{address['addressCountry']} {zipcode}",
+            ])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
@@ -81,11 +74,10 @@ class Exxon(scrapy.Spider):
         hours = {}
         try:
             for hours_data in obj["openingHoursSpecification"][0]:
+                open_time = convert_to_12h_format(hours_data['@opens'])
+                close_time = convert_to_12h_format(hours_data['@closes'])
                 for day in hours_data['@dayOfWeek']:
-                    hours[day.lower()] = {
-                        "open": convert_to_12h_format(hours_data['@opens']),
-                        "close": convert_to_12h_format(hours_data['@closes'])
-                    }
+                    hours[day.lower()] = {"open": open_time, "close": close_time}
             return hours
         except Exception as e:
             self.logger.error("Error getting hours: %s", e, exc_info=True)
@@ -6,22 +6,41 @@ from scrapy_store_scrapers.utils import *
 
 class FirestoneCompleteAutoCare(scrapy.Spider):
     name = "firestonecompleteautocare"
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
+        "DOWNLOAD_TIMEOUT": 30,
+    }
+    DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+    DAY_BY_PREFIX = {day[:3]: day for day in DAYS}
+
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.processed_store_numbers = set()
 
 
     def start_requests(self) -> Iterable[Request]:
         zipcodes = load_zipcode_data("data/zipcode_lat_long.json")
-        for zipcode in zipcodes:
+        # Neighbouring zipcodes in the same 0.25 degree cell return the same nearby stores
+        for zipcode in dedupe_zipcodes_by_cell(zipcodes, cell_size=0.25):
             url = f"https://www.firestonecompleteautocare.com/bsro/services/store/location/get-list-by-zip?zipCode={zipcode['zipcode']}"
             yield scrapy.Request(url, callback=self.parse)
 
 
     def parse(self, response: Response) -> Iterable[Dict]:
-        obj = json.loads(response.text)
+        obj = json_loads(response.body)
         if obj.get("success"):  
             stores = obj['data']['stores']
             for store in stores:
+                store_number = store.get("storeNumber")
+                if store_number:
+                    if store_number in self.processed_store_numbers:
+                        self.logger.debug("Skipping duplicate store: %s", store_number)
+                        continue
+                    self.processed_store_numbers.add(store_number)
                 yield {
-                    "number": store.get("storeNumber"),
+                    "number": store_number,
                     "name": store.get("storeName"),
                     "address": self._get_address(store),
                     "phone_number": store.get("phone"),
@@ -39,36 +58,27 @@ class FirestoneCompleteAutoCare(scrapy.Spider):
     
     def _get_address(self, store: Dict) -> str:
         try:
-            address_parts = [
-                store['address'],
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = store.get("city", "")
-            state = store.get("state", "")
-            zipcode = store.get("zip", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            return ", ".join(filter(None, [street, city_state_zip]))
+            state = store.get("state") or ""
+            zipcode = store.get("zip") or ""
+            return join_nonblank([store['address'], store.get("city"), f"{state} {zipcode}"])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
 
 
-    def _get_hours(self, store: Dict) -> List[Dict]:
+    def _get_hours(self, store: Dict) -> Dict:
         hours = {}
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
         try:
-            for day in days:
-                for hour in store['hours']:
-                    if hour['weekDay'].lower() in day:
-                        hours[day] = {
-                            "open": convert_to_12h_format(hour['openTime']),
-                            "close": convert_to_12h_format(hour['closeTime'])
-                        }
+            for hour in store['hours']:
+                day = self.DAY_BY_PREFIX.get(hour['weekDay'].lower()[:3])
+                if day is None:
+                    continue
+                hours[day] = {
+                    "open": convert_to_12h_format(hour['openTime']),
+                    "close": convert_to_12h_format(hour['closeTime'])
+                }
             return hours
         except Exception as e:
             self.logger.error(f"Error getting hours for store {store.get('storeNumber')}: {e}")
-            return []
+            return {}
 
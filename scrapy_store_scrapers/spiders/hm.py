@@ -5,6 +5,8 @@ from scrapy_store_scrapers.utils import *
 
 class Hm(scrapy.Spider):
     name = "hm"
+    DAYS = ("sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday")
+    DAY_BY_PREFIX = {day[:3]: day for day in DAYS}
 
 
     def start_requests(self) -> Iterable[scrapy.Request]:
@@ -13,7 +15,7 @@ class Hm(scrapy.Spider):
 
 
     def parse(self, response: Response) -> Iterable[Dict]:
-        stores = json.loads(response.text)['stores']
+        stores = json_loads(response.body)['stores']
         for store in stores:
             if store.get("region", {}).get("name", "") == "Puerto Rico":
                 continue
@@ -33,19 +35,19 @@ class Hm(scrapy.Spider):
 
     def _get_address(self, store: Dict) -> str:
         try:
-            address_parts = [
-                store['address']['streetName1'],
-                store['address']['streetName2']
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = store.get("city", "")
-            state = store['address'].get("state", "")
-            zipcode = store['address'].get("postCode", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            return ", ".join(filter(None, [street, city_state_zip])).strip(" US")
+            address = store['address']
+            state = address.get("state") or ""
+            zipcode = address.get("postCode") or ""
+            full_address = join_nonblank([
+                address['streetName1'],
+                address['streetName2'],
+                store.get("city"),
+                f"{state} {zipcode}",
+            ])
+            # Drop a trailing country code only, not every leading/trailing 'U'/'S'
+            if full_address.endswith(" US"):
+                full_address = full_address[:-3].rstrip(" ,")
+            return full_address
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
@@ -53,15 +55,15 @@ class Hm(scrapy.Spider):
 
     def _get_hours(self, store: Dict) -> Dict:
         hours = {}
-        days = ["sunday", "monday", "tuesday", "wednesday", "thursday", "friday", "saturday"]
         try:
-            for day in days:
-                for business_day in store['openingHours']:
-                    if business_day['name'].lower() in day:
-                        hours[day] = {
-                            "open": convert_to_12h_format(business_day['opens']),
-                            "close": convert_to_12h_format(business_day['closes'])
-                        }
+            for business_day in store['openingHours']:
+                day = self.DAY_BY_PREFIX.get(business_day['name'].lower()[:3])
+                if day is None:
+                    continue
+                hours[day] = {
+                    "open": convert_to_12h_format(business_day['opens']),
+                    "close": convert_to_12h_format(business_day['closes'])
+                }
             return hours
         except Exception as e:
             self.logger.error("Error getting hours: %s", e)
@@ -1,11 +1,14 @@
 import re
 import json
-from typing import Any, Dict, List, Optional, Tuple, Generator
-from urllib.parse import quote
+from typing import Any, Dict, Optional, Generator
+from urllib.parse import parse_qsl, quote, urlsplit
 
 import scrapy
 from scrapy.http import FormRequest, Response
 
+from scrapy_store_scrapers.utils import join_nonblank, json_loads, zipcode_cell_centers
+
+
 class HomegoodsSpider(scrapy.Spider):
     """Spider for scraping HomeGoods store information."""
 
@@ -18,15 +21,26 @@ class HomegoodsSpider(scrapy.Spider):
     STORE_URL_TEMPLATE = "https://www.homegoods.com/store-details/{}/{}"
     
     # Regular expressions
-    LOCATION_DATA_RE = r'var locationData = ({.*?});'
-    TIME_FORMAT_RE = r'(\d+)([ap]m)'
-    NORMALIZE_HOURS_RE = r'[^a-z0-9:]'
+    LOCATION_DATA_RE = re.compile(r'var locationData = ({.*?});', re.DOTALL)
+    TIME_FORMAT_RE = re.compile(r'(\d+)([ap]m)')
+    NORMALIZE_HOURS_RE = re.compile(r'[^a-z0-9:]')
+    DAY_PATTERN = r"(?:mon|tues?|wed(?:nes)?|thur?s?|fri|sat(?:ur)?|sun)(?:day)?"
+    TIME_PATTERN = r"(\d{1,2}(?::\d{2})?)([ap]m)"
+    TIME_RANGE_RE = re.compile(f"{TIME_PATTERN}{TIME_PATTERN}")
+    TIME_ONLY_RE = re.compile(f"^{TIME_PATTERN}{TIME_PATTERN}$")
+    # A day range ("monsat9am9pm") is tried before a single day ("sun10am8pm") at each position
+    BUSINESS_HOURS_RE = re.compile(
+        f"(?P<range>({DAY_PATTERN})({DAY_PATTERN})(?::)??{TIME_PATTERN}{TIME_PATTERN})"
+        f"|(?P<single>({DAY_PATTERN})(?::)??{TIME_PATTERN}{TIME_PATTERN})"
+    )
     
     # Day mapping
     DAY_MAPPING = {
         'sun': 'sunday', 'mon': 'monday', 'tue': 'tuesday', 'wed': 'wednesday',
         'thu': 'thursday', 'fri': 'friday', 'sat': 'saturday',
     }
+    DAY_ORDER = tuple(DAY_MAPPING)
+    DAY_INDEX = {day: i for i, day in enumerate(DAY_ORDER)}
 
     # Request headers
     REQUEST_HEADERS = {
@@ -51,13 +65,26 @@ class HomegoodsSpider(scrapy.Spider):
     def parse(self, response: Response) -> Generator[FormRequest, None, None]:
         """Parse the initial response and generate requests for each zipcode."""
         zipcodes = self._load_zipcode_data()
-        for zipcode in zipcodes:
-            yield FormRequest.from_response(
-                response,
-                formdata={
-                    'lat': str(zipcode["latitude"]),
-                    'lng': str(zipcode["longitude"]),
-                },
+        # Locate the form once; per-zipcode requests only swap the lat/lng fields
+        template = FormRequest.from_response(response, formdata={'lat': '', 'lng': ''})
+        if template.method == "POST":
+            query = template.body.decode(template.encoding)
+        else:
+            query = urlsplit(template.url).query
+        form_fields = [
+            (key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+            if key not in ('lat', 'lng')
+        ]
+        # Neighbouring zipcodes return the same nearby stores, so post the center of each
+        # 0.25 degree cell; no store in a cell is more than ~12 miles from its query point
+        for latitude, longitude in zipcode_cell_centers(zipcodes, cell_size=0.25):
+            yield FormRequest(
+                url=template.url,
+                method=template.method,
+                formdata=form_fields + [
+                    ('lat', str(latitude)),
+                    ('lng', str(longitude)),
+                ],
                 headers=self.REQUEST_HEADERS,
                 callback=self.parse_results,
             )
@@ -65,8 +92,8 @@ class HomegoodsSpider(scrapy.Spider):
     def _load_zipcode_data(self) -> list[dict[str, Any]]:
         """Load zipcode data from a JSON file."""
         try:
-            with open(self.ZIPCODE_FILE_PATH, 'r') as f:
-                return json.load(f)
+            with open(self.ZIPCODE_FILE_PATH, 'rb') as f:
+                return json_loads(f.read())
         except FileNotFoundError:
             self.logger.error("Zipcode data file not found: %s", self.ZIPCODE_FILE_PATH)
         except json.JSONDecodeError:
@@ -77,9 +104,9 @@ class HomegoodsSpider(scrapy.Spider):
         """Parse the results from each FormRequest."""
         script = response.xpath('//script[contains(text(), "var locationData =")]/text()').get()
         if script:
-            json_match = re.search(self.LOCATION_DATA_RE, script, re.DOTALL)
+            json_match = self.LOCATION_DATA_RE.search(script)
             if json_match:
-                location_data = json.loads(json_match.group(1))
+                location_data = json_loads(json_match.group(1))
                 stores = location_data.get('Stores', [])
                 yield from self._process_stores(stores)
             else:
@@ -130,19 +157,15 @@ class HomegoodsSpider(scrapy.Spider):
     def _get_address(self, store_info: dict[str, Any]) -> str:
         """Format store address."""
         try:
-            address_parts = [
-                store_info.get("Address", ""),
-                store_info.get("Address2", ""),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = store_info.get("City", "")
-            state = store_info.get("State", "")
-            zipcode = store_info.get("Zip", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            full_address = ", ".join(filter(None, [street, city_state_zip]))
+            state = store_info.get("State") or ""
+            zipcode = store_info.get("Zip") or ""
+
+            full_address = join_nonblank([
+                store_info.get("Address"),
+                store_info.get("Address2"),
+                store_info.get("City"),
+                f"{state} {zipcode}",
+            ])
             if not full_address:
                 self.logger.warning("Missing address information: %s", store_info)
             return full_address
@@ -168,12 +191,12 @@ class HomegoodsSpider(scrapy.Spider):
     @staticmethod
     def format_time(time_str: str) -> str:
         """Add a space before 'am' or 'pm' if not present."""
-        return re.sub(HomegoodsSpider.TIME_FORMAT_RE, r'\1 \2', time_str)
+        return HomegoodsSpider.TIME_FORMAT_RE.sub(r'\1 \2', time_str)
 
     @staticmethod
     def normalize_hours_text(hours_text: str) -> str:
         """Normalize the hours text by removing non-alphanumeric characters and converting to lowercase."""
-        return re.sub(HomegoodsSpider.NORMALIZE_HOURS_RE, '', hours_text.lower().replace('to', '').replace('thru', ''))
+        return HomegoodsSpider.NORMALIZE_HOURS_RE.sub('', hours_text.lower().replace('to', '').replace('thru', ''))
 
     def _get_hours(self, raw_store_data: dict[str, Any]) -> dict[str, dict[str, str]]:
         """Extract and parse store hours."""
@@ -198,14 +221,14 @@ class HomegoodsSpider(scrapy.Spider):
         elif 'open24hours' in input_text:
             input_text = input_text.replace('open24hours', '12:00am11:59pm')
 
-        day_ranges = self._extract_business_hour_range(input_text)
+        day_ranges, single_days = self._extract_business_hours(input_text)
         for start_day, end_day, open_time, close_time in day_ranges:
-            start_index = list(self.DAY_MAPPING.keys()).index(start_day)
-            end_index = list(self.DAY_MAPPING.keys()).index(end_day)
+            start_index = self.DAY_INDEX[start_day]
+            end_index = self.DAY_INDEX[end_day]
             if end_index < start_index:
                 end_index += 7
             for i in range(start_index, end_index + 1):
-                day = list(self.DAY_MAPPING.keys())[i % 7]
+                day = self.DAY_ORDER[i % 7]
                 full_day = self.DAY_MAPPING[day]
                 if result[full_day]['open'] and result[full_day]['close']:
                     self.logger.debug("Day %s already has hours (input_text=%s), skipping range %s to %s",
@@ -214,7 +237,6 @@ class HomegoodsSpider(scrapy.Spider):
                 result[full_day]['open'] = open_time
                 result[full_day]['close'] = close_time
 
-        single_days = self._extract_business_hours(input_text)
         for day, open_time, close_time in single_days:
             full_day = self.DAY_MAPPING[day]
             if result[full_day]['open'] and result[full_day]['close']:
@@ -230,59 +252,39 @@ class HomegoodsSpider(scrapy.Spider):
 
         return result
 
-    def _extract_business_hour_range(self, input_string: str) -> list[tuple[str, str, str, str]]:
-        """Extract business hour ranges from input string."""
-        days_re = r"(?:mon|tues?|wed(?:nes)?|thur?s?|fri|sat(?:ur)?|sun)"
-        day_suffix_re = r"(?:day)?"
-        optional_colon_re = r"(?::)?"
-        time_re = r"(\d{1,2}(?::\d{2})?)([ap]m)"
-
-        time_only_re = f"^{time_re}{time_re}$"
-        
+    def _extract_business_hours(
+        self, input_string: str
+    ) -> tuple[list[tuple[str, str, str, str]], list[tuple[str, str, str]]]:
+        """Extract day ranges and individual days from input string in a single pass."""
         if "daily" in input_string:
-            time_match = re.search(f"{time_re}{time_re}", input_string)
+            time_match = self.TIME_RANGE_RE.search(input_string)
             if time_match:
                 open_time = f"{time_match.group(1)} {time_match.group(2)}"
                 close_time = f"{time_match.group(3)} {time_match.group(4)}"
-                return [("sun", "sat", open_time, close_time)]
-        
-        time_only_match = re.match(time_only_re, input_string)
-        if re.match(time_only_re, input_string):
+                return [("sun", "sat", open_time, close_time)], []
+
+        time_only_match = self.TIME_ONLY_RE.match(input_string)
+        if time_only_match:
             open_time = f"{time_only_match.group(1)} {time_only_match.group(2)}"
             close_time = f"{time_only_match.group(3)} {time_only_match.group(4)}"
-            return [("sun", "sat", open_time, close_time)]
+            return [("sun", "sat", open_time, close_time)], []
+
+        day_ranges = []
+        single_days = []
+        for match in self.BUSINESS_HOURS_RE.finditer(input_string):
+            if match.lastgroup == "range":
+                start_day = match.group(2)[:3]
+                end_day = match.group(3)[:3]
+                open_time = f"{match.group(4)} {match.group(5)}"
+                close_time = f"{match.group(6)} {match.group(7)}"
+                day_ranges.append((start_day, end_day, open_time, close_time))
+            else:
+                day = match.group(9)[:3]
+                open_time = f"{match.group(10)} {match.group(11)}"
+                close_time = f"{match.group(12)} {match.group(13)}"
+                single_days.append((day, open_time, close_time))
 
-        pattern = f"({days_re}{day_suffix_re})({days_re}{day_suffix_re}){optional_colon_re}?{time_re}{time_re}"
-        matches = re.finditer(pattern, input_string, re.MULTILINE)
-        
-        results = []
-        for match in matches:
-            start_day = match.group(1)[:3]
-            end_day = match.group(2)[:3]
-            open_time = f"{match.group(3)} {match.group(4)}"
-            close_time = f"{match.group(5)} {match.group(6)}"
-            results.append((start_day, end_day, open_time, close_time))
-        
-        return results
-
-    def _extract_business_hours(self, input_string: str) -> list[tuple[str, str, str]]:
-        """Extract individual business hours from input string."""
-        days_re = r"(?:mon|tues?|wed(?:nes)?|thur?s?|fri|sat(?:ur)?|sun)"
-        day_suffix_re = r"(?:day)?"
-        optional_colon_re = r"(?::)?"
-        time_re = r"(\d{1,2}(?::\d{2})?)([ap]m)"
-        
-        pattern = f"({days_re}{day_suffix_re}){optional_colon_re}?{time_re}{time_re}"
-        matches = re.finditer(pattern, input_string, re.MULTILINE)
-        
-        results = []
-        for match in matches:
-            day = match.group(1)[:3]
-            open_time = f"{match.group(2)} {match.group(3)}"
-            close_time = f"{match.group(4)} {match.group(5)}"
-            results.append((day, open_time, close_time))
-        
-        return results
+        return day_ranges, single_days
 
     def _get_url(self, store_info: dict[str, Any]) -> str:
         """Generate the store URL."""
@@ -6,6 +6,8 @@ from typing import Any, Optional, Generator
 import scrapy
 from scrapy.http import Response
 
+from scrapy_store_scrapers.utils import TIME_12H_LOOKUP, join_nonblank, json_loads
+
 class HomesenseSpider(scrapy.Spider):
     """Spider for scraping Homesense store information."""
 
@@ -16,7 +18,8 @@ class HomesenseSpider(scrapy.Spider):
     required_fields = ['address', 'location', 'url', 'raw']
 
     STORE_URLS_XPATH = '//ul[@class="states-list"]/li//a[@class="store-details-link"]/@href'
-    STORE_DATA_RE = re.compile(r"pageProps: (.*),")
+    STORE_DATA_RE = re.compile(rb"pageProps: (.*),")
+    DAYS = frozenset({'sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday'})
 
     def parse(self, response: Response) -> Generator[scrapy.Request, None, None]:
         """Parse the main page and yield requests for individual store pages."""
@@ -26,12 +29,12 @@ class HomesenseSpider(scrapy.Spider):
     def parse_store(self, response: Response) -> Optional[dict[str, Any]]:
         """Parse individual store page and extract store information."""
         try:
-            store_json = self.STORE_DATA_RE.search(response.text)
+            store_json = self.STORE_DATA_RE.search(response.body)
             if not store_json:
-                self.logger.error(f"Failed to find store data in page: {response.url}")
+                self.logger.error("Failed to find store data in page: %s", response.url)
                 return None
 
-            store_data = json.loads(store_json.group(1))
+            store_data = json_loads(store_json.group(1))
             store = store_data['document']
 
             parsed_store = {
@@ -48,16 +51,16 @@ class HomesenseSpider(scrapy.Spider):
             self._log_missing_data(parsed_store)
 
             if not all(parsed_store.get(field) for field in self.required_fields):
-                self.logger.warning(f"Missing required fields for store {parsed_store.get('number', 'Unknown')}")
+                self.logger.warning("Missing required fields for store %s", parsed_store.get('number', 'Unknown'))
                 return None
 
             return parsed_store
         except json.JSONDecodeError:
-            self.logger.error(f"Failed to parse JSON data from store page: {response.url}")
+            self.logger.error("Failed to parse JSON data from store page: %s", response.url)
         except KeyError as e:
-            self.logger.error(f"Missing key in JSON data for store page: {response.url}, error: {e}")
+            self.logger.error("Missing key in JSON data for store page: %s, error: %s", response.url, e)
         except Exception as e:
-            self.logger.error(f"Unexpected error in parse_store method: {e}", exc_info=True)
+            self.logger.error("Unexpected error in parse_store method: %s", e, exc_info=True)
         return None
 
     def _get_services(self, store: dict) -> list:
@@ -66,17 +69,16 @@ class HomesenseSpider(scrapy.Spider):
             services_raw = store.get('_site', {}).get('c_servicesLocation', {}).get('servicesLink', [])
             return [service['cTA']['label'] for service in services_raw if service.get('cTA', {}).get('label')]
         except Exception as e:
-            self.logger.error(f"Error extracting services: {e}", exc_info=True)
+            self.logger.error("Error extracting services: %s", e, exc_info=True)
             return []
 
     def _get_hours(self, hours_dict: dict) -> dict:
         """Extract and format store hours."""
         formatted_hours = {}
-        days = ['sunday', 'monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday']
 
         for day, hours_info in hours_dict.items():
-            if day.lower() not in days:
-                self.logger.warning(f"Invalid day: {day}")
+            if day.lower() not in self.DAYS:
+                self.logger.warning("Invalid day: %s", day)
                 continue
             parsed_hours = self._parse_hours(hours_info)
             if parsed_hours:
@@ -89,10 +91,10 @@ class HomesenseSpider(scrapy.Spider):
             open_intervals = hours_info.get('openIntervals', [])
 
             if len(open_intervals) > 1:
-                self.logger.warning(f"Multiple intervals found: {open_intervals}")
+                self.logger.warning("Multiple intervals found: %s", open_intervals)
                 return {}
             elif not open_intervals:
-                self.logger.warning(f"No intervals found: {hours_info}")
+                self.logger.warning("No intervals found: %s", hours_info)
                 return {}
             
             open_interval = open_intervals[0]
@@ -104,9 +106,9 @@ class HomesenseSpider(scrapy.Spider):
                     "open": self._convert_to_12h_format(open_time),
                     "close": self._convert_to_12h_format(close_time)
                 }
-            self.logger.warning(f"Missing open or close time: {hours_info}")
+            self.logger.warning("Missing open or close time: %s", hours_info)
         except Exception as e:
-            self.logger.error(f"Error parsing hours info: {e}, {hours_info}", exc_info=True)
+            self.logger.error("Error parsing hours info: %s, %s", e, hours_info, exc_info=True)
         return {}
     
     @staticmethod
@@ -114,6 +116,9 @@ class HomesenseSpider(scrapy.Spider):
         """Convert time to 12-hour format."""
         if not time_str:
             return ""
+        converted = TIME_12H_LOOKUP.get(time_str)
+        if converted is not None:
+            return converted
         try:
             time_obj = datetime.strptime(time_str, '%H:%M').time()
             return time_obj.strftime('%I:%M %p').lower().lstrip('0')
@@ -123,24 +128,20 @@ class HomesenseSpider(scrapy.Spider):
     def _get_address(self, address_info: dict) -> str:
         """Format store address."""
         try:
-            address_parts = [
-                address_info.get("line1", ""),
-                address_info.get("line2", ""),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = address_info.get("city", "")
-            state = address_info.get("region", "")
-            zipcode = address_info.get("postalCode", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            full_address = ", ".join(filter(None, [street, city_state_zip]))
+            state = address_info.get("region") or ""
+            zipcode = address_info.get("postalCode") or ""
+
+            full_address = join_nonblank([
+                address_info.get("line1"),
+                address_info.get("line2"),
+                address_info.get("city"),
+                f"{state} {zipcode}",
+            ])
             if not full_address:
-                self.logger.warning(f"Missing address information: {address_info}")
+                self.logger.warning("Missing address information: %s", address_info)
             return full_address
         except Exception as e:
-            self.logger.error(f"Error formatting address: {e}", exc_info=True)
+            self.logger.error("Error formatting address: %s", e, exc_info=True)
             return ""
 
     def _get_location(self, location_info: dict) -> dict:
@@ -154,15 +155,15 @@ class HomesenseSpider(scrapy.Spider):
                     "type": "Point",
                     "coordinates": [float(longitude), float(latitude)]
                 }
-            self.logger.warning(f"Missing latitude or longitude: {location_info}")
+            self.logger.warning("Missing latitude or longitude: %s", location_info)
         except ValueError as e:
-            self.logger.warning(f"Invalid latitude or longitude values: {e}")
+            self.logger.warning("Invalid latitude or longitude values: %s", e)
         except Exception as e:
-            self.logger.error(f"Error extracting location: {e}", exc_info=True)
+            self.logger.error("Error extracting location: %s", e, exc_info=True)
         return {}
         
     def _log_missing_data(self, parsed_store: dict) -> None:
         """Log warnings for missing data in parsed store information."""
         for key, value in parsed_store.items():
             if key != 'raw' and not value:
-                self.logger.warning(f"Missing data for {key} in store: {parsed_store['number']}")
\ No newline at end of file
+                self.logger.warning("Missing data for %s in store: %s", key, parsed_store['number'])
\ No newline at end of file
@@ -4,14 +4,39 @@ import scrapy
 
 from typing import Union
 
+from scrapy_store_scrapers.utils import join_nonblank, json_loads
+
 
 class HondausaSpider(scrapy.Spider):
     name = "hondausa"
     allowed_domains = ["automobiles.honda.com"]
     zipcode_file_path = "data/tacobell_zipcode_data.json"
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
+    }
 
     zipcode_api_format_url = "https://automobiles.honda.com/platform/api/v2/dealer?productDivisionCode=A&excludeServiceCenters=true&zip={zipcode}&maxResults=16"
 
+    TIME_FORMAT_RE = re.compile(r'(\d+)([ap]m)')
+    DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+    DAY_INDEX = {day[:3]: index for index, day in enumerate(DAYS)}
+    SERVICES_MAP = {
+        'HC': 'Council of Excellence',
+        'GM': 'Battery Electric Vehicle Authorized Dealer',
+        '09': 'Express Service',
+        'FC': 'Fuel Cell Electric Vehicle Dealer',
+        'GA': 'Honda Environmental Leadership Award',
+        'GG': 'Honda Environmental Leadership Award - Gold Level',
+        'GP': 'Honda Environmental Leadership Award',
+        'GS': 'Honda Environmental Leadership Award',
+        'CM': 'Honda Service Pass',
+        'MC': 'Masters Circle',
+        'MO': 'Motocompacto Authorized Dealer',
+        '02': "President's Award",
+        'PE': "President's Award Elite"
+    }
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.processed_dealer_numbers = set()
@@ -26,8 +51,8 @@ class HondausaSpider(scrapy.Spider):
     def _load_zipcode_data(self) -> list[dict[str, Union[str, float]]]:
         """Load zipcode data from a JSON file."""
         try:
-            with open(self.zipcode_file_path, 'r') as f:
-                return json.load(f)
+            with open(self.zipcode_file_path, 'rb') as f:
+                return json_loads(f.read())
         except FileNotFoundError:
             self.logger.error("Zipcode data file not found: %s",
                               self.zipcode_file_path)
@@ -37,7 +62,7 @@ class HondausaSpider(scrapy.Spider):
         return []
 
     def parse(self, response):
-        data = response.json()
+        data = json_loads(response.body)
         stores = data["Dealers"]
 
         for store in stores:
@@ -46,7 +71,7 @@ class HondausaSpider(scrapy.Spider):
                 self.processed_dealer_numbers.add(dealer_number)
                 yield self._parse_store(store)
             else:
-                self.logger.debug(f"Duplicate store found: {dealer_number}")
+                self.logger.debug("Duplicate store found: %s", dealer_number)
 
     def _parse_store(self, store: dict[str, Union[str, float]]) -> dict[str, Union[str, float]]:
         """Parse individual store data."""
@@ -65,19 +90,14 @@ class HondausaSpider(scrapy.Spider):
     def _get_address(self, store_info: dict) -> str:
         """Format store address."""
         try:
-            address_parts = [
-                store_info.get("Address", "").strip(),
-                # store_info.get("line2", ""),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = store_info.get("City", "")
-            state = store_info.get("State", "")
-            zipcode = store_info.get("ZipCode", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            full_address = ", ".join(filter(None, [street, city_state_zip]))
+            state = store_info.get("State") or ""
+            zipcode = store_info.get("ZipCode") or ""
+
+            full_address = join_nonblank([
+                store_info.get("Address"),
+                store_info.get("City"),
+                f"{state} {zipcode}",
+            ])
             if not full_address:
                 self.logger.warning(
                     "Missing address information for store: %s", store_info)
@@ -111,26 +131,11 @@ class HondausaSpider(scrapy.Spider):
 
     def _get_services(self, store_info: dict) -> list:
         """Extract and parse services from custom fields."""
-        services_map = {
-            'HC': 'Council of Excellence',
-            'GM': 'Battery Electric Vehicle Authorized Dealer',
-            '09': 'Express Service',
-            'FC': 'Fuel Cell Electric Vehicle Dealer',
-            'GA': 'Honda Environmental Leadership Award',
-            'GG': 'Honda Environmental Leadership Award - Gold Level',
-            'GP': 'Honda Environmental Leadership Award',
-            'GS': 'Honda Environmental Leadership Award',
-            'CM': 'Honda Service Pass',
-            'MC': 'Masters Circle',
-            'MO': 'Motocompacto Authorized Dealer',
-            '02': "President's Award",
-            'PE': "President's Award Elite"
-        }
         service_codes = [service['Code'] for service in store_info.get("Attributes", [])]
-        available_services = [services_map.get(
-            service) for service in service_codes if service in services_map]
+        available_services = [self.SERVICES_MAP.get(
+            service) for service in service_codes if service in self.SERVICES_MAP]
 
-        unknown_services = set(service_codes) - set(services_map.keys())
+        unknown_services = set(service_codes).difference(self.SERVICES_MAP)
         if unknown_services:
             self.logger.debug(
                 "Unknown service types found: %s", ", ".join(unknown_services))
@@ -184,20 +189,14 @@ class HondausaSpider(scrapy.Spider):
     @staticmethod
     def format_time(time_str: str) -> str:
         """Add a space before 'am' or 'pm' if not present."""
-        return re.sub(r'(\d+)([ap]m)', r'\1 \2', time_str)
-
-    @staticmethod
-    def _get_days(start_day: str, end_day: str):
-        """Get list of days between start and end day."""
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
-        days_map = {
-            "mon": "monday", "tue": "tuesday", "wed": "wednesday",
-            "thu": "thursday", "fri": "friday", "sat": "saturday", "sun": "sunday"
-        }
+        return HondausaSpider.TIME_FORMAT_RE.sub(r'\1 \2', time_str)
 
-        start_index = days.index(days_map.get(start_day.lower()))
-        end_index = days.index(days_map.get(end_day.lower()))
+    @classmethod
+    def _get_days(cls, start_day: str, end_day: str):
+        """Get days between start and end day."""
+        start_index = cls.DAY_INDEX[start_day.lower()]
+        end_index = cls.DAY_INDEX[end_day.lower()]
 
         if start_index > end_index:
-            return days[start_index:] + days[:end_index + 1]
-        return days[start_index:end_index + 1]
+            return cls.DAYS[start_index:] + cls.DAYS[:end_index + 1]
+        return cls.DAYS[start_index:end_index + 1]
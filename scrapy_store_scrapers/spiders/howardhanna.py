@@ -2,7 +2,6 @@ import re
 import scrapy
 import json
 from scrapy.http import JsonRequest
-from copy import deepcopy
 from scrapy_store_scrapers.utils import *
 
 
@@ -18,6 +17,8 @@ class HowardHanna(scrapy.Spider):
         'OrderBy': 'Closest',
     }
     store_processed = set()
+    MAP_LIST_BATCH_SIZE = 50
+    OFFICE_ID_RE = re.compile(r"/Office/Detail/[^/?#]+/([^/?#]+)", re.IGNORECASE)
 
 
     def start_requests(self) -> Iterable[Request]:
@@ -39,7 +40,7 @@ class HowardHanna(scrapy.Spider):
 
 
     def parse(self, response: Response) -> Iterable[Dict]:
-        stores = json.loads(response.text).get("Properties", [])
+        stores = json_loads(response.body).get("Properties", [])
         partial_items = []
         for store in stores:
             store_id = store.get("MlsNumber")
@@ -57,50 +58,50 @@ class HowardHanna(scrapy.Spider):
             partial_items.append(partial_item)
 
 
-        payload = {"propertyKeys": []}
-        for idx, item in enumerate(partial_items, start=1):
-            payload["propertyKeys"].append({"MlsName": "Office", "MlsNumber": f"{item['number']}"})
-            if idx % 10 == 0:
-                yield JsonRequest(
-                    url="https://www.howardhanna.com/Office/MapList",
-                    callback=self.parse_store,
-                    method="POST",
-                    data=deepcopy(payload),
-                    cb_kwargs={"partial_items": partial_items},
-                )
-                payload['propertyKeys'].clear()
-        yield JsonRequest(
-            url="https://www.howardhanna.com/Office/MapList",
-            callback=self.parse_store,
-            method="POST",
-            data=deepcopy(payload),
-            cb_kwargs={"partial_items": partial_items},
-        )
+        for start in range(0, len(partial_items), self.MAP_LIST_BATCH_SIZE):
+            batch = partial_items[start:start + self.MAP_LIST_BATCH_SIZE]
+            payload = {
+                "propertyKeys": [{"MlsName": "Office", "MlsNumber": f"{item['number']}"} for item in batch]
+            }
+            yield JsonRequest(
+                url="https://www.howardhanna.com/Office/MapList",
+                callback=self.parse_store,
+                method="POST",
+                data=payload,
+                cb_kwargs={"partial_items": batch},
+            )
 
 
     def parse_store(self, response: Response, partial_items: List[Dict]):
+        phones = self._get_phones(response)
         for store in partial_items:
-            store_id = store['number']
-            phone = response.xpath(f"//tr//a[contains(@href, '{store_id}')]/ancestor::tr/preceding-sibling::tr//a/text()").get()
+            phone = phones.get(str(store['number']))
             if phone:
                 store.update({"phone_number": phone})
                 yield store
 
 
-    def _get_address(self, address_obj: Dict) -> str:
-        try:
-            address_parts = [
-                address_obj.get("Address", ""),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = address_obj.get("City", "")
-            state = address_obj.get("StateProv", "")
-            zipcode = address_obj.get("ZipCode", "")
+    def _get_phones(self, response: Response) -> Dict[str, str]:
+        """Map each office id linked in the MapList table to the first link text in an earlier row."""
+        phones = {}
+        for table in response.xpath("//tr/.."):
+            first_link_text = None
+            for row in table.xpath("./tr"):
+                if first_link_text is not None:
+                    for href in row.xpath(".//a/@href").getall():
+                        match = self.OFFICE_ID_RE.search(href)
+                        if match:
+                            phones.setdefault(match.group(1), first_link_text)
+                if first_link_text is None:
+                    first_link_text = row.xpath(".//a/text()").get()
+        return phones
 
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
 
-            return ", ".join(filter(None, [street, city_state_zip]))
+    def _get_address(self, address_obj: Dict) -> str:
+        try:
+            state = address_obj.get("StateProv") or ""
+            zipcode = address_obj.get("ZipCode") or ""
+            return join_nonblank([address_obj.get("Address"), address_obj.get("City"), f"{state} {zipcode}"])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
@@ -4,6 +4,8 @@ from urllib.parse import urlencode
 
 import scrapy
 
+from scrapy_store_scrapers.utils import join_nonblank, json_loads
+
 
 class HyundaiusaSpider(scrapy.Spider):
     """Spider for scraping Hyundai USA dealer information."""
@@ -13,6 +15,17 @@ class HyundaiusaSpider(scrapy.Spider):
     zipcode_file_path = "data/tacobell_zipcode_data.json"
     zipcode_api_base_url = "https://www.hyundaiusa.com/var/hyundai/services/dealer.dealerByZip.service"
 
+    REQUEST_HEADERS = {
+        "Accept": "application/json, text/plain, */*",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Referer": "https://www.hyundaiusa.com/us/en/dealer-locator",
+        "Referrer-Policy": "strict-origin-when-cross-origin"
+    }
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
+    }
+
     def __init__(self, *args, **kwargs):
         """Initialize the spider."""
         super().__init__(*args, **kwargs)
@@ -30,21 +43,14 @@ class HyundaiusaSpider(scrapy.Spider):
                 "maxdealers": "10"
             }
 
-            headers = {
-                "Accept": "application/json, text/plain, */*",
-                "Accept-Language": "en-US,en;q=0.9",
-                "Referer": "https://www.hyundaiusa.com/us/en/dealer-locator",
-                "Referrer-Policy": "strict-origin-when-cross-origin"
-            }
-
             url = f"{self.zipcode_api_base_url}?{urlencode(params)}"
-            yield scrapy.Request(url, headers=headers, callback=self.parse)
+            yield scrapy.Request(url, headers=self.REQUEST_HEADERS, callback=self.parse)
 
     def _load_zipcode_data(self) -> list[dict[str, Union[str, float]]]:
         """Load zipcode data from a JSON file."""
         try:
-            with open(self.zipcode_file_path, 'r') as f:
-                return json.load(f)
+            with open(self.zipcode_file_path, 'rb') as f:
+                return json_loads(f.read())
         except FileNotFoundError:
             self.logger.error("Zipcode data file not found: %s", self.zipcode_file_path)
         except json.JSONDecodeError:
@@ -54,7 +60,7 @@ class HyundaiusaSpider(scrapy.Spider):
     def parse(self, response: scrapy.http.Response) -> Generator[dict[str, Union[str, float, dict]], None, None]:
         """Parse the JSON response and yield store data."""
         try:
-            data = response.json()
+            data = json_loads(response.body)
             stores = data.get("dealers", [])
 
             for store in stores:
@@ -101,20 +107,14 @@ class HyundaiusaSpider(scrapy.Spider):
     def _get_address(self, store_info: dict[str, str]) -> str:
         """Format store address."""
         try:
-            address_parts = [
-                store_info.get("address1", "").strip(),
-                store_info.get("address2", "").strip(),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = store_info.get("city", "")
-            state = store_info.get("state", "")
-            zipcode = store_info.get("zipCd", "")
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            full_address = ", ".join(filter(None, [street, city_state_zip]))
-            return full_address
+            state = store_info.get("state") or ""
+            zipcode = store_info.get("zipCd") or ""
+            return join_nonblank([
+                store_info.get("address1"),
+                store_info.get("address2"),
+                store_info.get("city"),
+                f"{state} {zipcode}",
+            ])
         except Exception as e:
             self.logger.error("Failed to get address: %s", str(e), exc_info=True)
             return ""
@@ -5,6 +5,8 @@ from urllib.parse import urljoin
 import scrapy
 from scrapy.http import Response
 
+from scrapy_store_scrapers.utils import json_loads
+
 
 class IrvingOilSpider(scrapy.Spider):
     """Spider for scraping Irving Oil store data."""
@@ -12,16 +14,39 @@ class IrvingOilSpider(scrapy.Spider):
     name = "irvingoil"
     allowed_domains = ["www.irvingoil.com"]
     start_urls = ["https://www.irvingoil.com/location/geojson/%7B%22ibp%22:false%7D"]
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
+    }
 
     NAME_XPATH = '//h1[@class="page-title"]/span/text()'
     ADDRESS_ELEM_STRING_XPATH = 'string(//div[@class="location__address"])'
     SERVICES_XPATH = '//div[@class="location__amenities--amenities"]/ul/li/text()'
     HOURS_XPATH = 'normalize-space(//div[contains(@class,"location__hours")]/table/tbody)'
 
+    NON_DIGIT_RE = re.compile(r'\D')
+    NORMALIZE_HOURS_RE = re.compile(r'[^a-z0-9:]')
+    DAY_PATTERN = r"(?:mon|tues?|wed(?:nes)?|thur?s?|fri|sat(?:ur)?|sun)(?:day)?"
+    TIME_PATTERN = r"(\d{1,2}(?::\d{2})?)([ap]m)"
+    TIME_RANGE_RE = re.compile(f"{TIME_PATTERN}{TIME_PATTERN}")
+    TIME_ONLY_RE = re.compile(f"^{TIME_PATTERN}{TIME_PATTERN}$")
+    # A day range ("monsat9am9pm") is tried before a single day ("sun10am8pm") at each position
+    BUSINESS_HOURS_RE = re.compile(
+        f"(?P<range>({DAY_PATTERN})({DAY_PATTERN})(?::)??{TIME_PATTERN}{TIME_PATTERN})"
+        f"|(?P<single>({DAY_PATTERN})(?::)??{TIME_PATTERN}{TIME_PATTERN})"
+    )
+
+    DAY_MAPPING = {
+        'sun': 'sunday', 'mon': 'monday', 'tue': 'tuesday', 'wed': 'wednesday',
+        'thu': 'thursday', 'fri': 'friday', 'sat': 'saturday',
+    }
+    DAY_ORDER = tuple(DAY_MAPPING)
+    DAY_INDEX = {day: i for i, day in enumerate(DAY_ORDER)}
+
     def parse(self, response: Response) -> Generator[scrapy.Request, None, None]:
         """Parse the initial JSON response and yield requests for individual store pages."""
         try:
-            data = response.json()
+            data = json_loads(response.body)
             for store in data.get('features', []):
                 store_properties = store.get('properties', {})
                 store_link = store_properties.get('link')
@@ -79,7 +104,7 @@ class IrvingOilSpider(scrapy.Spider):
         try:
             phone_number = store_info.get('phone')
             if phone_number:
-                cleaned_number = re.sub(r'\D', '', phone_number)
+                cleaned_number = self.NON_DIGIT_RE.sub('', phone_number)
                 if len(cleaned_number) != 10:
                     self.logger.warning(f"Invalid phone number format: {phone_number}")
                     return None
@@ -133,26 +158,21 @@ class IrvingOilSpider(scrapy.Spider):
     @staticmethod
     def _normalize_hours_text(hours_text: str) -> str:
         """Normalize the hours text by removing non-alphanumeric characters and converting to lowercase."""
-        return re.sub(r'[^a-z0-9:]', '', hours_text.lower().replace('to', '').replace('thru', ''))
+        return IrvingOilSpider.NORMALIZE_HOURS_RE.sub('', hours_text.lower().replace('to', '').replace('thru', ''))
 
     def _parse_business_hours(self, input_text: str) -> dict:
         """Parse business hours from input text."""
-        DAY_MAPPING = {
-            'sun': 'sunday', 'mon': 'monday', 'tue': 'tuesday', 'wed': 'wednesday',
-            'thu': 'thursday', 'fri': 'friday', 'sat': 'saturday',
-        }
-        result = {day: {'open': None, 'close': None} for day in DAY_MAPPING.values()}
+        result = {day: {'open': None, 'close': None} for day in self.DAY_MAPPING.values()}
 
         if input_text == "open24hours":
-            return {day: {'open': '12:00 am', 'close': '11:59 pm'} for day in DAY_MAPPING.values()}
+            return {day: {'open': '12:00 am', 'close': '11:59 pm'} for day in self.DAY_MAPPING.values()}
         elif '24hours' in input_text:
             input_text = input_text.replace('24hours', '12:00am11:59pm')
 
-        day_ranges = self._extract_business_hour_range(input_text)
-        single_days = self._extract_business_hours(input_text)
+        day_ranges, single_days = self._extract_business_hours(input_text)
 
-        self._process_day_ranges(day_ranges, result, DAY_MAPPING)
-        self._process_single_days(single_days, result, DAY_MAPPING)
+        self._process_day_ranges(day_ranges, result)
+        self._process_single_days(single_days, result)
 
         for day, hours in result.items():
             if hours['open'] is None or hours['close'] is None:
@@ -161,17 +181,16 @@ class IrvingOilSpider(scrapy.Spider):
         return result
 
     def _process_day_ranges(self, day_ranges: List[Tuple[str, str, str, str]],
-                            result: dict[str, dict[str, Optional[str]]],
-                            DAY_MAPPING: dict[str, str]) -> None:
+                            result: dict[str, dict[str, Optional[str]]]) -> None:
         """Process day ranges and update the result dictionary."""
         for start_day, end_day, open_time, close_time in day_ranges:
-            start_index = list(DAY_MAPPING.keys()).index(start_day)
-            end_index = list(DAY_MAPPING.keys()).index(end_day)
+            start_index = self.DAY_INDEX[start_day]
+            end_index = self.DAY_INDEX[end_day]
             if end_index < start_index:
                 end_index += 7
             for i in range(start_index, end_index + 1):
-                day = list(DAY_MAPPING.keys())[i % 7]
-                full_day = DAY_MAPPING[day]
+                day = self.DAY_ORDER[i % 7]
+                full_day = self.DAY_MAPPING[day]
                 if result[full_day]['open'] and result[full_day]['close']:
                     self.logger.debug(f"Day {full_day} already has hours, skipping range {start_day} to {end_day}")
                     continue
@@ -179,59 +198,41 @@ class IrvingOilSpider(scrapy.Spider):
                 result[full_day]['close'] = close_time
 
     def _process_single_days(self, single_days: List[Tuple[str, str, str]],
-                             result: dict[str, dict[str, Optional[str]]],
-                             DAY_MAPPING: dict[str, str]) -> None:
+                             result: dict[str, dict[str, Optional[str]]]) -> None:
         """Process single days and update the result dictionary."""
         for day, open_time, close_time in single_days:
-            full_day = DAY_MAPPING[day]
+            full_day = self.DAY_MAPPING[day]
             if result[full_day]['open'] and result[full_day]['close']:
                 self.logger.debug(f"Day {full_day} already has hours, skipping individual day {day}")
                 continue
             result[full_day]['open'] = open_time
             result[full_day]['close'] = close_time
 
-    def _extract_business_hour_range(self, input_string: str) -> List[Tuple[str, str, str, str]]:
-        """Extract business hour ranges from input string."""
-        days_re = r"(?:mon|tues?|wed(?:nes)?|thur?s?|fri|sat(?:ur)?|sun)"
-        day_suffix_re = r"(?:day)?"
-        optional_colon_re = r"(?::)?"
-        time_re = r"(\d{1,2}(?::\d{2})?)([ap]m)"
-
-        time_only_re = f"^{time_re}{time_re}$"
-        
+    def _extract_business_hours(
+        self, input_string: str
+    ) -> Tuple[List[Tuple[str, str, str, str]], List[Tuple[str, str, str]]]:
+        """Extract day ranges and individual days from input string in a single pass."""
         if "daily" in input_string:
-            time_match = re.search(f"{time_re}{time_re}", input_string)
+            time_match = self.TIME_RANGE_RE.search(input_string)
             if time_match:
                 open_time = f"{time_match.group(1)} {time_match.group(2)}"
                 close_time = f"{time_match.group(3)} {time_match.group(4)}"
-                return [("sun", "sat", open_time, close_time)]
-        
-        time_only_match = re.match(time_only_re, input_string)
+                return [("sun", "sat", open_time, close_time)], []
+
+        time_only_match = self.TIME_ONLY_RE.match(input_string)
         if time_only_match:
             open_time = f"{time_only_match.group(1)} {time_only_match.group(2)}"
             close_time = f"{time_only_match.group(3)} {time_only_match.group(4)}"
-            return [("sun", "sat", open_time, close_time)]
-
-        pattern = f"({days_re}{day_suffix_re})({days_re}{day_suffix_re}){optional_colon_re}?{time_re}{time_re}"
-        matches = re.finditer(pattern, input_string)
-        
-        return [
-            (match.group(1)[:3], match.group(2)[:3], 
-             f"{match.group(3)} {match.group(4)}", f"{match.group(5)} {match.group(6)}")
-            for match in matches
-        ]
-
-    def _extract_business_hours(self, input_string: str) -> List[Tuple[str, str, str]]:
-        """Extract individual business hours from input string."""
-        days_re = r"(?:mon|tues?|wed(?:nes)?|thur?s?|fri|sat(?:ur)?|sun)"
-        day_suffix_re = r"(?:day)?"
-        optional_colon_re = r"(?::)?"
-        time_re = r"(\d{1,2}(?::\d{2})?)([ap]m)"
-        
-        pattern = f"({days_re}{day_suffix_re}){optional_colon_re}?{time_re}{time_re}"
-        matches = re.finditer(pattern, input_string)
-        
-        return [
-            (match.group(1)[:3], f"{match.group(2)} {match.group(3)}", f"{match.group(4)} {match.group(5)}")
-            for match in matches
-        ]
\ No newline at end of file
+            return [("sun", "sat", open_time, close_time)], []
+
+        day_ranges = []
+        single_days = []
+        for match in self.BUSINESS_HOURS_RE.finditer(input_string):
+            if match.lastgroup == "range":
+                day_ranges.append((match.group(2)[:3], match.group(3)[:3],
+                                   f"{match.group(4)} {match.group(5)}", f"{match.group(6)} {match.group(7)}"))
+            else:
+                single_days.append((match.group(9)[:3],
+                                    f"{match.group(10)} {match.group(11)}", f"{match.group(12)} {match.group(13)}"))
+
+        return day_ranges, single_days
@@ -1,3 +1,5 @@
+import json
+import re
 import scrapy
 from scrapy_store_scrapers.utils import *
 import chompjs
@@ -7,39 +9,54 @@ import chompjs
 class JackInTheBoxSpider(scrapy.Spider):
     name = "jackinthebox"
     start_urls = ["https://locations.jackinthebox.com/us"]
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
+    }
+
+    STATE_URLS_XPATH = "//a[@class='state']/@href"
+    CITY_URLS_XPATH = "//div[contains(@class, 'city-name')]/a/@href"
+    STORE_URLS_XPATH = "//div[@data-location-address]/a[@class='name']/@href"
+    STORE_JSON_XPATH = "//script[@type='application/ld+json' and contains(text(), 'openingHoursSpecification')]/text()"
+    LOBBY_HOURS_XPATH = "//div[@id='hoursAccordion']//div[@id='lobbyHours']/div"
+    DAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+    LOCATION_NUMBER_RE = re.compile(r"dimensionLocationNumber\'\:\s\'(\d+)\'")
+    AMENITIES_RE = re.compile(r"(?:amenitiesString\s=\s\")(.*?)(?:\")")
 
 
     def parse(self, response: Response):
-        states = response.xpath("//a[@class='state']/@href").getall()
+        states = response.xpath(self.STATE_URLS_XPATH).getall()
         for state in states:
             yield Request(response.urljoin(state), callback=self.parse_state)
 
 
     def parse_state(self, response: Response):
-        cities = response.xpath("//div[contains(@class, 'city-name')]/a/@href").getall()
+        cities = response.xpath(self.CITY_URLS_XPATH).getall()
         for city in cities:
             yield Request(response.urljoin(city), callback=self.parse_city)
 
 
     def parse_city(self, response: Response):
-        stores = response.xpath("//div[@data-location-address]/a[@class='name']/@href").getall()
+        stores = response.xpath(self.STORE_URLS_XPATH).getall()
         for store in stores:
             yield Request(response.urljoin(store), callback=self.parse_store)
 
     
     def parse_store(self, response: Response):
-        obj = chompjs.parse_js_object(response.xpath("//script[contains(text(), 'openingHoursSpecification')]/text()").get())
+        scripts = response.xpath("//script/text()").getall()
+        store_json = response.xpath(self.STORE_JSON_XPATH).get()
+        if store_json is None:
+            self.logger.warning("No JSON-LD store data on %s", response.url)
+        obj = self._load_store_json(store_json) if store_json is not None else {}
+        geo = obj.get('geo') or {}
         item = {
-            "number": response.xpath("//script[contains(text(), 'dimensionLocationNumber')]/text()").re_first(r"dimensionLocationNumber\'\:\s\'(\d+)\'"),
-            "name": obj['name'],
-            "address": self._get_address(obj['address']),
-            "location": {
-                "type": "Point",
-                "coordinates": [float(obj['geo']['longitude']), float(obj['geo']['latitude'])]
-            },
-            "phone_number": obj['telephone'],
-            "hours": self._get_hours(obj['openingHoursSpecification'], response),
-            "serives": self._get_services(response),
+            "number": self._search_scripts(scripts, 'dimensionLocationNumber', self.LOCATION_NUMBER_RE),
+            "name": obj.get('name'),
+            "address": self._get_address(obj.get('address') or {}),
+            "location": make_point(geo.get('latitude'), geo.get('longitude')),
+            "phone_number": obj.get('telephone'),
+            "hours": self._get_hours(obj.get('openingHoursSpecification') or [], response),
+            "serives": self._get_services(scripts),
             "url": response.url,
             "raw": obj,
             "coming_soon": False
@@ -52,40 +69,28 @@ class JackInTheBoxSpider(scrapy.Spider):
 
     def _get_address(self, node: Dict) -> str:
         try:
-            address_parts = [
-                node.get("streetAddress", ""),
-            ]
-            street = ", ".join(filter(None, address_parts))
-
-            city = node.get("addressLocality", "")
-            state = node.get("addressRegion", "")
-            zipcode = node.get("postalCode", "")
-            if "-" in zipcode:
-                zipcode = zipcode.split("-")[0]
-
-            city_state_zip = f"{city}, {state} {zipcode}".strip()
-
-            return ", ".join(filter(None, [street, city_state_zip]))
+            state = node.get("addressRegion") or ""
+            zipcode = (node.get("postalCode") or "").split("-")[0]
+            return join_nonblank([node.get("streetAddress"), node.get("addressLocality"), f"{state} {zipcode}"])
         except Exception as e:
             self.logger.error("Error getting address: %s", e, exc_info=True)
             return ""
         
 
     def _get_hours(self, hours_data: Dict, response: Response) -> Dict:
-        days = ["monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday"]
         hours = {}
         try:
-            for day in days:
-                for hour_range in hours_data:
-                    if day in hour_range['dayOfWeek'].lower():
-                        if hour_range['opens'].lower().replace(".", "") == "closed":
-                            continue
-                        hours[day] = {
-                            "open": hour_range['opens'].lower().replace(".", ""),
-                            "close": hour_range['closes'].lower().replace(".", "")
-                        }
+            for hour_range in hours_data:
+                open_time = hour_range['opens'].lower().replace(".", "")
+                if open_time == "closed":
+                    continue
+                close_time = hour_range['closes'].lower().replace(".", "")
+                day_of_week = hour_range['dayOfWeek'].lower()
+                for day in self.DAYS:
+                    if day in day_of_week:
+                        hours[day] = {"open": open_time, "close": close_time}
             if not hours:
-                for block in response.xpath("//div[@id='hoursAccordion']//div[@id='lobbyHours']/div"):
+                for block in response.xpath(self.LOBBY_HOURS_XPATH):
                     day = block.xpath("./div[1]/text()").get().strip().lower() # if equal to Today then get the day name from datetime.
                     if day == "today":
                         day = datetime.now().strftime("%A").lower()
@@ -103,12 +108,33 @@ class JackInTheBoxSpider(scrapy.Spider):
             return {}
     
     
-    def _get_services(self, response: Response):
+    @staticmethod
+    def _load_store_json(script_text: str) -> Dict:
+        """Decode the JSON-LD block, falling back to chompjs for non-strict JSON."""
+        try:
+            return json_loads(script_text)
+        except json.JSONDecodeError:
+            return chompjs.parse_js_object(script_text)
+
+
+    @staticmethod
+    def _search_scripts(scripts: List[str], marker: str, pattern: re.Pattern) -> Optional[str]:
+        """Return the first pattern match among the scripts that contain marker."""
+        for script in scripts:
+            if marker in script:
+                match = pattern.search(script)
+                if match:
+                    return match.group(1)
+        return None
+
+
+    def _get_services(self, scripts: List[str]):
         services = []
         try:
-            if not response.xpath("//script[contains(text(), 'amenitiesString')]/text()").get():
+            amenities = self._search_scripts(scripts, 'amenitiesString', self.AMENITIES_RE)
+            if amenities is None:
                 return []
-            services_mapping = chompjs.parse_js_object(response.xpath("//script[contains(text(), 'amenitiesString')]/text()").re_first(r"(?:amenitiesString\s=\s\")(.*?)(?:\")"))
+            services_mapping = chompjs.parse_js_object(amenities)
             for service, status in services_mapping.items():
                 if status == "true":
                     if 'has_' in service:
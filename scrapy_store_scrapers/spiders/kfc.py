@@ -1,14 +1,19 @@
-import json
 from datetime import datetime
 from typing import Generator
 
 import scrapy
 from scrapy.http import Response
 
+from scrapy_store_scrapers.utils import json_loads
+
 class KfcSpider(scrapy.Spider):
     name = "kfc"
     allowed_domains = ["locations.kfc.com"]
     start_urls = ["https://locations.kfc.com"]
+    custom_settings = {
+        "CONCURRENT_REQUESTS": 64,
+        "CONCURRENT_REQUESTS_PER_DOMAIN": 32,
+    }
 
     LOCATION_URL_XPATH = '//ul[@class="Directory-listLinks"]/li/a/@href'
     STORE_URLS_XPATH = '//ul[@class="Directory-listTeasers Directory-row"]//h2/a/@href'
@@ -93,7 +98,7 @@ class KfcSpider(scrapy.Spider):
         else:
             try:
                 item['hours'] = {}
-                hours_data = json.loads(hours_json)
+                hours_data = json_loads(hours_json)
 
                 for day_dict in hours_data:
                     day = day_dict['day'].lower()
@@ -1,23 +1,47 @@
 from datetime import datetime
-from typing import Dict, Iterable, Any, Generator, Union, List
+from functools import lru_cache
+from typing import Dict, Iterable, Any, Generator, Optional, Union, List
 import json
+import re
 from scrapy.http import Response, Request
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, fall back to the stdlib decoder
+    orjson = None
+
+TIME_12H_LOOKUP = {
+    f"{hour:02d}:{minute:02d}": datetime(2000, 1, 1, hour, minute).strftime('%I:%M %p').lower().lstrip('0')
+    for hour in range(24)
+    for minute in range(60)
+}
+# LocalBusiness payloads use "24:00" for midnight closing, which strptime rejects
+TIME_12H_LOOKUP["24:00"] = "12:00 am"
+
+BLOCKED_RESOURCE_TYPES = frozenset({"image"})
+BLOCKED_URL_PARTS = (
+    ".jpg", ".woff", ".facebook.net", "googlemanager.com", "stackadapt.com",
+    "google-analytics.com", "clarity.ms", "googletagmanager.com", "youtube.com",
+)
+BLOCKED_URL_RE = re.compile("|".join(re.escape(part) for part in BLOCKED_URL_PARTS))
+
+
 def should_abort_request(request):
-    not_allowed = [".facebook.net","googlemanager.com","stackadapt.com","google-analytics.com","clarity.ms","googletagmanager.com"
-                   "youtube.com"]
+    """Abort images, fonts and known tracker requests made by Playwright pages."""
     return (
-        request.resource_type == "image"
-        or ".jpg" in request.url
-        or ".woff" in request.url
-        or any([True for domain in not_allowed if domain in request.url])
+        request.resource_type in BLOCKED_RESOURCE_TYPES
+        or BLOCKED_URL_RE.search(request.url) is not None
     )
 
+
+@lru_cache(maxsize=2048)
 def convert_to_12h_format(time_str: str) -> str:
     """Convert time to 12-hour format."""
     time_str = time_str.lower()
     if not time_str:
         return None
+    if time_str in TIME_12H_LOOKUP:
+        return TIME_12H_LOOKUP[time_str]
     try:
         if "am" in time_str:
             time_str = time_str.lower().replace("am", "").strip()
@@ -48,11 +72,78 @@ def convert_to_12h_format(time_str: str) -> str:
         return None
     
 
+def json_loads(data: Union[str, bytes]) -> Any:
+    """Decode JSON with orjson when installed, otherwise with the stdlib."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def make_point(latitude: Any, longitude: Any) -> dict[str, Any]:
+    """Build a GeoJSON point from latitude/longitude, or {} if either is missing or invalid."""
+    if latitude is None or longitude is None:
+        return {}
+    try:
+        return {"type": "Point", "coordinates": [float(longitude), float(latitude)]}
+    except (TypeError, ValueError):
+        return {}
+
+
+def join_nonblank(parts: Iterable[Optional[str]], sep: str = ", ") -> str:
+    """Join address parts, dropping blank ones and stray edge commas/whitespace."""
+    return sep.join(
+        part for part in (raw.strip(" ,\t\r\n") for raw in parts if raw) if part
+    )
+
+
 def load_zipcode_data(zipcode_file_path: str) -> list[dict[str, Union[str, float]]]:
     """Load zipcode data from a JSON file."""
-    with open(zipcode_file_path, 'r') as f:
-        return json.load(f)
-    
+    with open(zipcode_file_path, 'rb') as f:
+        return json_loads(f.read())
+
+
+def _zipcode_cell(zipcode: dict[str, Union[str, float]], cell_size: float) -> tuple[int, int]:
+    """Return the lat/long grid cell a zipcode falls in."""
+    return (
+        round(float(zipcode['latitude']) / cell_size),
+        round(float(zipcode['longitude']) / cell_size),
+    )
+
+
+def dedupe_zipcodes_by_cell(
+    zipcodes: Iterable[dict[str, Union[str, float]]], cell_size: float = 0.1
+) -> Generator[dict[str, Union[str, float]], None, None]:
+    """Yield only the first zipcode that falls in each lat/long grid cell."""
+    seen_cells = set()
+    for zipcode in zipcodes:
+        cell = _zipcode_cell(zipcode, cell_size)
+        if cell in seen_cells:
+            continue
+        seen_cells.add(cell)
+        yield zipcode
+
+
+def group_zipcodes_by_cell(
+    zipcodes: Iterable[dict[str, Union[str, float]]], cell_size: float = 0.1
+) -> list[list[dict[str, Union[str, float]]]]:
+    """Group zipcodes by lat/long grid cell, keeping file order within and across cells."""
+    groups = {}
+    for zipcode in zipcodes:
+        groups.setdefault(_zipcode_cell(zipcode, cell_size), []).append(zipcode)
+    return list(groups.values())
+
+
+def zipcode_cell_centers(
+    zipcodes: Iterable[dict[str, Union[str, float]]], cell_size: float = 0.1
+) -> Generator[tuple[float, float], None, None]:
+    """Yield the (latitude, longitude) center of each lat/long grid cell that holds a zipcode."""
+    seen_cells = set()
+    for zipcode in zipcodes:
+        cell = _zipcode_cell(zipcode, cell_size)
+        if cell in seen_cells:
+            continue
+        seen_cells.add(cell)
+        yield round(cell[0] * cell_size, 6), round(cell[1] * cell_size, 6)
 
 
 import re